@@ -3,6 +3,7 @@ Demo of multi-agent travel planning workflow
 """
 
 import asyncio
+import sys
 from google_adk import RuntimeConfig, RuntimeManager, AgentFactory, AgentOrchestrator, get_logger
 from agents.research_agent import ResearchAgent
 from agents.planning_agent import PlanningAgent  
@@ -10,6 +11,11 @@ from agents.coordinator_agent import CoordinatorAgent
 from workflows.travel_planning import create_travel_workflow
 from examples.tool_setup import setup_tools
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 
 async def main():
     """Run travel planning demo"""
@@ -32,9 +38,11 @@ async def main():
     factory.register_agent_type("coordinator", CoordinatorAgent)
     
     # Create agents
-    await factory.create_agent("research_agent", "research")
-    await factory.create_agent("planning_agent", "planning") 
-    await factory.create_agent("coordinator_agent", "coordinator")
+    await factory.create_agents_bulk([
+        ("research_agent", "research"),
+        ("planning_agent", "planning"),
+        ("coordinator_agent", "coordinator")
+    ])
     
     # Execute workflow
     workflow = create_travel_workflow("Paris", 2000, 3)
@@ -47,4 +55,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -4,14 +4,14 @@ Handles agent instantiation, registration, and lifecycle management
 """
 
 import asyncio
-from typing import Dict, Any, Type, Optional, List
+from typing import Dict, Any, Type, Optional, List, Callable, Tuple
 from abc import ABC, abstractmethod
 
 from .runtime_config import RuntimeConfig, AgentConfig, RuntimeManager
 from .logging_config import get_logger
 from .exceptions import (
     AgentError, AgentNotFoundError, AgentAlreadyExistsError,
-    AgentStartupError, ValidationError, ToolError, handle_exception
+    AgentStartupError, ValidationError, ToolNotFoundError, handle_exception
 )
 from tools.tool_registry import get_tool_registry
 
@@ -35,6 +35,9 @@ class BaseAgent(ABC):
         self.logger = get_logger(f"agent.{self.name}", agent_name=self.name)
         self.tool_registry = get_tool_registry()
         
+        # Notified with (agent, capability, added) when capabilities change
+        self._capability_listener: Optional[Callable[["BaseAgent", str, bool], None]] = None
+        
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize the agent
@@ -164,6 +167,8 @@ class BaseAgent(ABC):
         capability = capability.strip()
         if capability not in self.capabilities:
             self.capabilities.append(capability)
+            if self._capability_listener:
+                self._capability_listener(self, capability, True)
             self.logger.info_operation(
                 "capability_add",
                 f"Added capability: {capability}",
@@ -177,6 +182,8 @@ class BaseAgent(ABC):
         capability = capability.strip()
         if capability in self.capabilities:
             self.capabilities.remove(capability)
+            if self._capability_listener:
+                self._capability_listener(self, capability, False)
             self.logger.info_operation(
                 "capability_remove",
                 f"Removed capability: {capability}",
@@ -187,10 +194,11 @@ class BaseAgent(ABC):
         
     async def use_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Use a tool from the registry"""
-        tool = self.tool_registry.get(tool_name)
-        if not tool:
-            raise ToolError(f"Tool {tool_name} not found")
-        return await tool.execute(params)
+        try:
+            pending = self.tool_registry.call(tool_name, params)
+        except KeyError:
+            raise ToolNotFoundError(f"Tool {tool_name} not found") from None
+        return await pending
 
 
 class AgentFactory:
@@ -200,6 +208,7 @@ class AgentFactory:
         self.runtime = runtime
         self.agent_types: Dict[str, Type[BaseAgent]] = {}
         self.agents: Dict[str, BaseAgent] = {}
+        self.capabilities_index: Dict[str, Dict[str, BaseAgent]] = {}  # capability -> agents by name
         
     def register_agent_type(self, agent_type: str, agent_class: Type[BaseAgent]):
         """Register an agent type with the factory"""
@@ -211,6 +220,41 @@ class AgentFactory:
         if agent_type not in self.agent_types:
             raise ValueError(f"Unknown agent type: {agent_type}")
             
+        agent = self._register_agent(name, agent_type, config)
+        
+        # Start the agent
+        await agent.start()
+        
+        return agent
+        
+    async def create_agents_bulk(self, specs: List[Tuple[str, str]]) -> List[BaseAgent]:
+        """Create and register several agents, starting them concurrently
+        
+        Args:
+            specs: (name, agent_type) pairs, created with default configs
+            
+        Returns:
+            The created agents, in the order of ``specs``
+            
+        Raises:
+            ValueError: If any agent type is unknown; nothing is created
+        """
+        for _, agent_type in specs:
+            if agent_type not in self.agent_types:
+                raise ValueError(f"Unknown agent type: {agent_type}")
+                
+        agents = [self._register_agent(name, agent_type) for name, agent_type in specs]
+        
+        # Start all agents together, surfacing the first failure like create_agent
+        outcomes = await asyncio.gather(*(agent.start() for agent in agents), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            
+        return agents
+        
+    def _register_agent(self, name: str, agent_type: str, config: Optional[AgentConfig] = None) -> BaseAgent:
+        """Instantiate an agent and register it with the runtime and factory"""
         if config is None:
             config = AgentConfig(name=name, agent_type=agent_type)
             
@@ -221,8 +265,10 @@ class AgentFactory:
         self.runtime.register_agent(name, agent)
         self.agents[name] = agent
         
-        # Start the agent
-        await agent.start()
+        # Index capabilities now and track changes made during/after startup
+        for capability in agent.capabilities:
+            self._on_capability_change(agent, capability, True)
+        agent._capability_listener = self._on_capability_change
         
         return agent
         
@@ -232,10 +278,20 @@ class AgentFactory:
         
     def get_agents_by_capability(self, capability: str) -> list:
         """Get all agents that have a specific capability"""
-        return [
-            agent for agent in self.agents.values()
-            if agent.has_capability(capability)
-        ]
+        if not capability or not capability.strip():
+            return []
+        return list(self.capabilities_index.get(capability.strip(), {}).values())
+        
+    def _on_capability_change(self, agent: BaseAgent, capability: str, added: bool) -> None:
+        """Keep the capability index in sync with agent capabilities"""
+        if added:
+            self.capabilities_index.setdefault(capability, {})[agent.name] = agent
+        else:
+            agents = self.capabilities_index.get(capability)
+            if agents:
+                agents.pop(agent.name, None)
+                if not agents:
+                    del self.capabilities_index[capability]
         
     async def stop_all_agents(self):
         """Stop all agents"""
@@ -3,7 +3,7 @@ Agent Orchestrator for multi-agent conversations and workflows
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -23,7 +23,7 @@ class ConversationStep:
     agent_name: str
     method: str
     params: Dict[str, Any]
-    depends_on: List[str] = field(default_factory=list)
+    depends_on: Sequence[str] = field(default_factory=list)
     retry_count: int = 0
     max_retries: int = 3
     can_delegate: bool = True
@@ -91,15 +91,15 @@ class AgentOrchestrator:
                     raise WorkflowError(f"Step {step.method} failed after {step.max_retries} retries: {str(e)}")
                 await asyncio.sleep(1.0 * (attempt + 1))  # Exponential backoff
         
-    async def _wait_for_dependencies(self, deps: List[str], results: Dict) -> None:
+    async def _wait_for_dependencies(self, deps: Sequence[str], results: Dict) -> None:
         """Wait for dependency completion"""
         while not all(dep in results for dep in deps):
             await asyncio.sleep(0.1)
             
     async def _find_delegate(self, method: str) -> Optional[Any]:
         """Find agent capable of delegated task"""
-        for agent in self.agent_factory.agents.values():
-            if agent.has_capability(method) and agent.is_running:
+        for agent in self.agent_factory.get_agents_by_capability(method):
+            if agent.is_running:
                 return agent
         return None
         
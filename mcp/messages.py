@@ -3,7 +3,8 @@ MCP Message Types and Schemas
 Defines the message structures for Model Context Protocol communication
 """
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Literal
+from typing_extensions import Annotated
 from pydantic import BaseModel, Field
 from enum import Enum
 import uuid
@@ -43,7 +44,7 @@ class MCPMessage(BaseModel):
 class RequestMessage(MCPMessage):
     """Request message for asking agents to perform tasks"""
     
-    type: MessageType = MessageType.REQUEST
+    type: Literal[MessageType.REQUEST] = MessageType.REQUEST
     method: str
     params: Dict[str, Any] = Field(default_factory=dict)
     expects_response: bool = True
@@ -53,7 +54,7 @@ class RequestMessage(MCPMessage):
 class ResponseMessage(MCPMessage):
     """Response message for replying to requests"""
     
-    type: MessageType = MessageType.RESPONSE
+    type: Literal[MessageType.RESPONSE] = MessageType.RESPONSE
     request_id: str
     success: bool = True
     result: Optional[Dict[str, Any]] = None
@@ -63,7 +64,7 @@ class ResponseMessage(MCPMessage):
 class NotificationMessage(MCPMessage):
     """Notification message for broadcasting information"""
     
-    type: MessageType = MessageType.NOTIFICATION
+    type: Literal[MessageType.NOTIFICATION] = MessageType.NOTIFICATION
     event: str
     data: Dict[str, Any] = Field(default_factory=dict)
 
@@ -71,12 +72,19 @@ class NotificationMessage(MCPMessage):
 class ErrorMessage(MCPMessage):
     """Error message for reporting failures"""
     
-    type: MessageType = MessageType.ERROR
+    type: Literal[MessageType.ERROR] = MessageType.ERROR
     error_code: str
     error_message: str
     details: Optional[Dict[str, Any]] = None
 
 
+# Any concrete message, selected by its "type" field when parsing
+AnyMessage = Annotated[
+    Union[RequestMessage, ResponseMessage, NotificationMessage, ErrorMessage],
+    Field(discriminator="type")
+]
+
+
 class AgentCapability(BaseModel):
     """Represents an agent capability"""
     
@@ -6,17 +6,23 @@ Handles Model Context Protocol communication between agents
 import asyncio
 import json
 import logging
+import time
 from typing import Dict, Any, Optional, Callable, List
 from datetime import datetime, timedelta
 import aiohttp
 from aiohttp import web
+from pydantic import TypeAdapter, ValidationError
 
 from .messages import (
     MCPMessage, RequestMessage, ResponseMessage, NotificationMessage, ErrorMessage,
-    MessageType, create_response, create_notification
+    AnyMessage, create_response, create_notification
 )
 
 
+# Parses raw JSON straight into the matching message class
+_message_adapter = TypeAdapter(AnyMessage)
+
+
 class MCPProtocol:
     """Core MCP protocol implementation"""
     
@@ -29,11 +35,23 @@ class MCPProtocol:
         self.message_handlers: Dict[str, Callable] = {}
         self.pending_requests: Dict[str, asyncio.Future] = {}
         self.subscribers: Dict[str, List[Callable]] = {}
+        self._dispatch: Dict[type, Callable] = {
+            RequestMessage: self._handle_request,
+            ResponseMessage: self._handle_response,
+            NotificationMessage: self._handle_notification,
+            ErrorMessage: self._handle_error
+        }
         
         # Connection management
         self.is_connected = False
         self.session: Optional[aiohttp.ClientSession] = None
         self.server: Optional[web.Application] = None
+        self._msg_url_cache: Dict[str, str] = {}
+        
+        # Cached health check body, refreshed at most once per interval
+        self._health_body: bytes = b""
+        self._health_ts: float = 0.0
+        self._health_interval: float = 1.0
         
         # Logging
         self.logger = logging.getLogger(f"MCP.{agent_name}")
@@ -44,7 +62,7 @@ class MCPProtocol:
             return
             
         # Create HTTP session for outbound requests
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(headers={"Content-Type": "application/json"})
         
         # Start HTTP server for inbound messages
         await self._start_server()
@@ -77,8 +95,8 @@ class MCPProtocol:
     async def _handle_incoming_message(self, request: web.Request) -> web.Response:
         """Handle incoming MCP messages via HTTP"""
         try:
-            data = await request.json()
-            message = self._parse_message(data)
+            body = await request.read()
+            message = self._parse_message_json(body)
             
             if message:
                 await self._process_message(message)
@@ -92,43 +110,30 @@ class MCPProtocol:
             
     async def _handle_health_check(self, request: web.Request) -> web.Response:
         """Health check endpoint"""
-        return web.json_response({
-            "agent": self.agent_name,
-            "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        now = time.monotonic()
+        if not self._health_body or now - self._health_ts > self._health_interval:
+            self._health_body = json.dumps({
+                "agent": self.agent_name,
+                "status": "healthy",
+                "timestamp": datetime.utcnow().isoformat()
+            }).encode()
+            self._health_ts = now
+        return web.Response(body=self._health_body, content_type="application/json")
         
-    def _parse_message(self, data: Dict[str, Any]) -> Optional[MCPMessage]:
-        """Parse incoming message data"""
+    def _parse_message_json(self, body: bytes) -> Optional[MCPMessage]:
+        """Parse a raw JSON message body without building an intermediate dict"""
         try:
-            message_type = data.get("type")
-            
-            if message_type == MessageType.REQUEST:
-                return RequestMessage(**data)
-            elif message_type == MessageType.RESPONSE:
-                return ResponseMessage(**data)
-            elif message_type == MessageType.NOTIFICATION:
-                return NotificationMessage(**data)
-            elif message_type == MessageType.ERROR:
-                return ErrorMessage(**data)
-            else:
-                self.logger.warning(f"Unknown message type: {message_type}")
-                return None
-                
-        except Exception as e:
+            return _message_adapter.validate_json(body)
+        except ValidationError as e:
             self.logger.error(f"Error parsing message: {e}")
             return None
             
     async def _process_message(self, message: MCPMessage):
         """Process an incoming message"""
-        if isinstance(message, RequestMessage):
-            await self._handle_request(message)
-        elif isinstance(message, ResponseMessage):
-            await self._handle_response(message)
-        elif isinstance(message, NotificationMessage):
-            await self._handle_notification(message)
-        elif isinstance(message, ErrorMessage):
-            await self._handle_error(message)
+        # _parse_message_json builds exact message classes, so dispatch on type directly
+        handler = self._dispatch.get(type(message))
+        if handler:
+            await handler(message)
             
     async def _handle_request(self, request: RequestMessage):
         """Handle incoming request messages"""
@@ -198,17 +203,13 @@ class MCPProtocol:
             
         try:
             # Determine target endpoint
-            target_url = self._get_agent_endpoint(target_agent or message.recipient)
+            message_url = self._get_message_url(target_agent or message.recipient)
             
-            # Serialize message
-            message_data = message.model_dump()
+            # Serialize message straight to JSON bytes
+            body: bytes = message.__pydantic_serializer__.to_json(message)
             
             # Send HTTP request
-            async with self.session.post(
-                f"{target_url}/mcp/message",
-                json=message_data,
-                headers={"Content-Type": "application/json"}
-            ) as response:
+            async with self.session.post(message_url, data=body) as response:
                 if response.status == 200:
                     self.logger.debug(f"Message sent successfully to {target_agent}")
                     return True
@@ -265,6 +266,14 @@ class MCPProtocol:
             # Broadcast to all known agents (implementation depends on discovery service)
             self.logger.info(f"Broadcasting notification: {event}")
             
+    def _get_message_url(self, agent_name: str) -> str:
+        """Get the cached message URL for an agent"""
+        url = self._msg_url_cache.get(agent_name)
+        if url is None:
+            url = f"{self._get_agent_endpoint(agent_name)}/mcp/message"
+            self._msg_url_cache[agent_name] = url
+        return url
+        
     def _get_agent_endpoint(self, agent_name: str) -> str:
         """Get the endpoint URL for an agent (simplified implementation)"""
         # In a real implementation, this would use a discovery service
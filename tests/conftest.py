@@ -3,7 +3,9 @@ Pytest configuration and fixtures for google-adk tests
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import sys
 import tempfile
 import shutil
 from pathlib import Path
@@ -19,9 +21,19 @@ from mcp.discovery import AgentRegistry, DiscoveryClient
 from mcp.messages import AgentInfo, AgentCapability
 
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
+
 # Configure test logging
 configure_logging(log_level="DEBUG", console_output=False)
 
+# Use uvloop for faster I/O scheduling when available
+if uvloop is not None and sys.platform != "win32":
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -91,7 +103,7 @@ def mock_agent_class():
             
         async def initialize(self) -> None:
             """Mock initialization"""
-            await asyncio.sleep(0.01)  # Simulate some async work
+            await asyncio.sleep(0)  # Yield to the event loop to simulate async work
             self.initialized = True
             
         async def process_message(self, message: dict) -> dict:
@@ -183,6 +195,22 @@ def mock_aiohttp_session(mock_http_response):
     return mock_session
 
 
+@pytest_asyncio.fixture
+async def eager_tasks():
+    """Start new tasks eagerly on the test loop (Python 3.12+)"""
+    if not hasattr(asyncio, "eager_task_factory"):
+        yield
+        return
+        
+    loop = asyncio.get_running_loop()
+    previous_factory = loop.get_task_factory()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    try:
+        yield
+    finally:
+        loop.set_task_factory(previous_factory)
+
+
 @pytest.fixture(autouse=True)
 async def cleanup_resources():
     """Automatically cleanup resources after each test"""
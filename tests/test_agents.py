@@ -3,31 +3,72 @@ Unit tests for individual agents and tools
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import json
 from unittest.mock import AsyncMock, patch
 
 from google_adk.agent_factory import BaseAgent, AgentFactory
 from google_adk.runtime_config import AgentConfig, RuntimeManager, RuntimeConfig
-from google_adk.exceptions import AgentError, AgentStartupError, ValidationError
+from google_adk.exceptions import AgentError, AgentStartupError, ValidationError, ToolNotFoundError
 from google_adk.context_managers import managed_agent
 from agents.research_agent import ResearchAgent
 from agents.planning_agent import PlanningAgent
 from agents.coordinator_agent import CoordinatorAgent
 from tools.optimization_tools import PlanningOptimizerTool, BudgetOptimizerTool
+from tools import quality_tools
 from tools.quality_tools import DataQualityTool, PlanValidatorTool
+from tools.composition_tools import ToolChainTool, ToolComposerTool
+from tools.reporting_tools import ReportGeneratorTool, SummaryTool
+from tools.validation_tools import ValidationTool
+from tools.tool_registry import BaseTool, get_tool_registry
+from examples.tool_setup import setup_tools
 
 
-@pytest.fixture
-async def runtime_setup():
-    """Setup runtime for testing"""
-    config = RuntimeConfig(environment="test")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_runtime():
+    """Setup a runtime shared by the whole test session"""
+    setup_tools()
+    
+    config = RuntimeConfig(environment="testing")
     runtime = RuntimeManager(config)
     await runtime.start()
-    factory = AgentFactory(runtime)
-    yield factory
+    yield runtime
     await runtime.stop()
 
 
+@pytest.fixture
+async def runtime_setup(session_runtime):
+    """Provide a fresh factory on the shared runtime"""
+    factory = AgentFactory(session_runtime)
+    yield factory
+    
+    # Release agents created by the test so the shared runtime stays clean
+    await factory.stop_all_agents()
+    for name in factory.agents:
+        session_runtime.unregister_agent(name)
+
+
+class FailingTool(BaseTool):
+    """Tool that always raises, for composition failure tests"""
+    
+    @property
+    def name(self):
+        return "failing_tool"
+        
+    async def execute(self, params):
+        raise RuntimeError("tool exploded")
+
+
+@pytest.fixture
+def failing_tool():
+    """Register a FailingTool for the duration of a test"""
+    registry = get_tool_registry()
+    registry.register(FailingTool())
+    yield registry
+    registry.tools.pop("failing_tool", None)
+
+
 @pytest.mark.asyncio
 class TestSpecificAgents:
     """Test specific agent implementations"""
@@ -88,6 +129,17 @@ class TestAdvancedTools:
         assert "optimized_plan" in result
         assert "budget_allocation" in result["optimized_plan"]
         assert result["optimized_plan"]["cost_savings"] > 0
+        assert result["optimized_plan"]["budget_allocation"]["accommodation"] == 800
+        
+        schedule = result["optimized_plan"]["schedule_optimization"]
+        assert [entry["day"] for entry in schedule] == [1, 2, 3, 4, 5]
+        
+        # Cached plan contents must not leak mutations between calls
+        schedule[0]["efficiency_score"] = 0
+        result["optimized_plan"]["budget_allocation"]["accommodation"] = 0
+        again = await tool.execute(params)
+        assert again["optimized_plan"]["schedule_optimization"][0]["efficiency_score"] == 0.85
+        assert again["optimized_plan"]["budget_allocation"]["accommodation"] == 800
         
     async def test_budget_optimizer_tool(self):
         """Test budget optimizer"""
@@ -99,6 +151,8 @@ class TestAdvancedTools:
         assert "allocations" in result
         assert "total" in result
         assert result["total"] <= 1000
+        assert result["total"] == pytest.approx(sum(result["allocations"].values()))
+        assert tool.execute_sync(params) == result
         
     async def test_data_quality_tool(self):
         """Test data quality checker"""
@@ -114,6 +168,67 @@ class TestAdvancedTools:
         assert result["quality_score"] > 0.5
         assert result["status"] in ["good", "needs_improvement"]
         
+    async def test_data_quality_tool_issues(self):
+        """Test data quality checker reports each kind of issue"""
+        tool = DataQualityTool()
+        
+        params = {
+            "data": {"budget": 60000, "destination": " ", "days": 0},
+            "required_fields": ["budget", "days", "hotel"]
+        }
+        result = await tool.execute(params)
+        
+        assert result["issues"] == [
+            "Missing fields: ['days', 'hotel']",
+            "Empty string values found",
+            "Budget outside reasonable range"
+        ]
+        assert result["quality_score"] == 0.0
+        assert result["status"] == "needs_improvement"
+
+    async def test_data_quality_tool_batch(self):
+        """Test batch quality checks match per-record execution"""
+        tool = DataQualityTool()
+        required_fields = ["destination", "budget"]
+        records = [
+            {"destination": "Paris", "budget": 3000},
+            {"destination": "", "budget": 60000},
+            {"budget": 50}
+        ]
+
+        results = tool.execute_batch(records, required_fields)
+
+        assert len(results) == len(records)
+        for record, result in zip(records, results):
+            assert result == await tool.execute({"data": record, "required_fields": required_fields})
+        assert results[0]["status"] == "good"
+
+    async def test_validation_tool_rules(self):
+        """Test structured validation rules are compiled once and enforced"""
+        tool = ValidationTool()
+        rules = [["gt", "budget", 0], ["in", "currency", ["EUR", "USD"]], ["not_null", "days"], "days_valid"]
+
+        assert tool.compile_rules(rules) is tool.compile_rules(rules)
+
+        result = await tool.execute({"data": {"budget": 500, "currency": "EUR", "days": 3}, "rules": rules})
+        assert result["valid"] is True
+        assert result["rules_checked"] == 4
+
+        for data in ({"budget": 0, "currency": "EUR", "days": 3},
+                     {"budget": 500, "currency": "GBP", "days": 3},
+                     {"budget": "500", "currency": "EUR", "days": 3},
+                     {"budget": 500, "currency": "EUR"}):
+            result = await tool.execute({"data": data, "rules": rules})
+            assert result["valid"] is False
+
+        assert tool.compile_rules([["in", "currency", {"EUR"}]])({"currency": "EUR"})
+
+        for bad_rule in (["matches", "budget", ".*"], {"op": "gt", "field": "budget"},
+                         ["not_null"], ("gt", "budget"), ["gt", "budget", [1, [2]]],
+                         ["in", "currency", "EUR"]):
+            with pytest.raises(ValueError, match="Invalid validation rule"):
+                tool.compile_rules([bad_rule])
+
     async def test_plan_validator_tool(self):
         """Test plan validator"""
         tool = PlanValidatorTool()
@@ -131,6 +246,305 @@ class TestAdvancedTools:
         assert "checks" in result
         assert result["confidence"] > 0
 
+    async def test_plan_validator_reports_failed_checks(self):
+        """Test plan validator flags each failing check"""
+        tool = PlanValidatorTool()
+
+        result = await tool.execute({"plan": {"budget": 1500, "destination": " "}})
+
+        assert result["valid"] is False
+        assert result["confidence"] == 0.4
+        assert result["checks"] == {
+            "budget_check": {"valid": True, "message": "Budget valid"},
+            "schedule_check": {"valid": False, "message": "No schedule provided"},
+            "location_check": {"valid": False, "message": "No destination specified"}
+        }
+        
+    async def test_plan_validator_fast_mode(self):
+        """Test fast validation stops at the cheapest failing check"""
+        tool = PlanValidatorTool()
+
+        result = await tool.execute({"plan": {"budget": 0}, "fast": True})
+        assert result == {"valid": False, "failed": "budget", "confidence": 0.4}
+
+        result = await tool.execute({"plan": {"budget": 100, "schedule": []}, "fast": True})
+        assert result["failed"] == "location"
+
+        plan = {"budget": 100, "destination": "Paris", "schedule": ["Day 1: Museum"]}
+        result = await tool.execute({"plan": plan, "fast": True})
+        assert result == {"valid": True, "failed": None, "confidence": 0.9}
+
+    async def test_plan_validator_async_checks(self, monkeypatch):
+        """Test async plan checks run concurrently alongside sync checks"""
+        calls = []
+
+        async def slow_location_check(plan):
+            calls.append("location")
+            await asyncio.sleep(0)
+            return plan.get("destination") == "Paris"
+
+        checks = quality_tools._PLAN_CHECKS
+        monkeypatch.setattr(quality_tools, "_PLAN_CHECKS", (*checks[:2], slow_location_check))
+
+        plan = {"budget": 1500, "destination": "Paris", "schedule": ["Day 1: Museum"]}
+        result = await PlanValidatorTool().execute({"plan": plan})
+        assert result["valid"] is True
+        assert result["checks"]["location_check"]["message"] == "Destination valid"
+
+        result = await PlanValidatorTool().execute({"plan": {**plan, "destination": "Rome"}})
+        assert result["checks"]["location_check"]["valid"] is False
+        assert calls == ["location", "location"]
+
+    async def test_report_generator_summary_cached(self):
+        """Test summary reports are reused across unrelated plan edits"""
+        tool = ReportGeneratorTool()
+        plan_data = {"destination": "Paris", "budget": 2000, "days": 4, "activities": ["Louvre"]}
+
+        first = await tool.execute({"plan_data": plan_data})
+        first["key_highlights"].append("mutated")
+        second = await tool.execute({"plan_data": {**plan_data, "notes": "window seat"}})
+
+        assert second["key_highlights"] == ["Budget: $2000", "Duration: 4 days", "Activities: 1"]
+        assert second["destination"] == "Paris"
+
+        detailed = await tool.execute({"plan_data": {**plan_data, "budget": 2000.0}, "format": "detailed"})
+        assert detailed["executive_summary"]["key_highlights"][0] == "Budget: $2000.0"
+
+    async def test_report_generator_unhashable_plan_values(self):
+        """Test reports still build when plan values cannot key the cache"""
+        tool = ReportGeneratorTool()
+        plan_data = {"destination": ["Paris", "Rome"], "budget": {"total": 3000, "currency": "EUR"}, "days": 6}
+
+        summary = await tool.execute({"plan_data": plan_data})
+        assert summary["destination"] == ["Paris", "Rome"]
+        assert summary["key_highlights"][0] == "Budget: ${'total': 3000, 'currency': 'EUR'}"
+
+        detailed = await tool.execute({"plan_data": plan_data, "format": "detailed"})
+        assert json.loads(tool.to_json_bytes(plan_data, "detailed")) == detailed
+
+    async def test_report_generator_json_bytes(self):
+        """Test reports encoded straight to JSON match the dict reports"""
+        tool = ReportGeneratorTool()
+        plan_data = {
+            "destination": "Rome",
+            "budget": 1200,
+            "days": 3,
+            "budget_allocation": {"accommodation": 480.0},
+            "schedule": [{"day": 1, "activity": "Colosseum"}],
+            "recommendations": ["Book early"]
+        }
+
+        for format_type in ("summary", "detailed"):
+            encoded = tool.to_json_bytes(plan_data, format_type)
+            expected = await tool.execute({"plan_data": plan_data, "format": format_type})
+            assert isinstance(encoded, bytes)
+            assert json.loads(encoded) == expected
+
+    async def test_summary_tool_word_count(self):
+        """Test summary word count covers only the returned points"""
+        result = await SummaryTool().execute({
+            "data": {"destination": "New York", "budget": 900, "days": 2},
+            "max_points": 2
+        })
+
+        assert result["summary"] == ["Destination: New York", "Budget: $900"]
+        assert result["word_count"] == 5
+
+    async def test_use_tool_calls_registry(self, mock_agent):
+        """Test agents run tools through the registry and report unknown tools"""
+        setup_tools()
+
+        result = await mock_agent.use_tool("budget_optimizer", {"budget": 1000})
+        assert result["total"] == 1000
+
+        with pytest.raises(ToolNotFoundError, match="missing_tool"):
+            await mock_agent.use_tool("missing_tool", {})
+
+    async def test_tool_composer_parallel(self, failing_tool):
+        """Test parallel composition isolates failing tools"""
+        setup_tools()
+        result = await ToolComposerTool().execute({
+            "composition": {
+                "type": "parallel",
+                "tools": [
+                    {"tool": "budget_optimizer", "params": {"budget": 1000}},
+                    {"tool": "failing_tool"},
+                    {"tool": "missing_tool"}
+                ]
+            },
+            "data": {"destination": "Paris"}
+        })
+            
+        results = result["results"]
+        assert result["execution_type"] == "parallel"
+        assert results["budget_optimizer"]["total"] == 1000
+        assert results["failing_tool"] == "tool exploded"
+        assert results["missing_tool"] == "Tool missing_tool not found"
+
+    async def test_tool_composer_parallel_respects_execute_override(self):
+        """Test the synchronous fast path is skipped when execute is overridden"""
+        class TaggedBudgetTool(BudgetOptimizerTool):
+            @property
+            def name(self):
+                return "tagged_budget"
+
+            async def execute(self, params):
+                result = await super().execute(params)
+                return {**result, "tagged": True}
+
+        registry = get_tool_registry()
+        registry.register(TaggedBudgetTool())
+        try:
+            result = await ToolComposerTool().execute({
+                "composition": {
+                    "type": "parallel",
+                    "tools": [{"tool": "tagged_budget", "params": {"budget": 1000}}]
+                }
+            })
+        finally:
+            registry.tools.pop("tagged_budget", None)
+
+        assert result["results"]["tagged_budget"]["tagged"] is True
+
+    async def test_tool_composer_fail_fast(self, failing_tool):
+        """Test fail_fast composition cancels remaining tools on first failure"""
+        started = []
+        
+        class SlowTool(BaseTool):
+            @property
+            def name(self):
+                return "slow_tool"
+                
+            async def execute(self, params):
+                started.append(asyncio.current_task())
+                await asyncio.sleep(10)
+                return {"done": True}
+                
+        registry = failing_tool
+        registry.register(SlowTool())
+        try:
+            result = await ToolComposerTool().execute({
+                "composition": {
+                    "type": "parallel",
+                    "fail_fast": True,
+                    "tools": [{"tool": "slow_tool"}, {"tool": "slow_tool"}, {"tool": "failing_tool"}]
+                }
+            })
+        finally:
+            registry.tools.pop("slow_tool", None)
+            
+        assert result["results"] == {"failing_tool": "tool exploded"}
+        # Both copies of the duplicated tool were cancelled, none leaked
+        assert len(started) == 2
+        assert all(task.cancelled() for task in started)
+        
+    async def test_tool_composer_sequential(self):
+        """Test sequential composition accumulates results without aliasing inputs"""
+        setup_tools()
+        shared = {"destination": "Paris", "budget": 1500}
+        
+        result = await ToolComposerTool().execute({
+            "composition": {
+                "type": "sequential",
+                "tools": [
+                    {"tool": "validate_data"},
+                    {"tool": "budget_optimizer", "params": {"budget": 1500}},
+                    {"tool": "summarizer"}
+                ]
+            },
+            "data": shared
+        })
+        
+        results = result["results"]
+        assert shared == {"destination": "Paris", "budget": 1500}
+        assert results["validate_data"]["data"] == shared
+        assert "Destination: Paris" in results["summarizer"]["summary"]
+        
+    async def test_tool_composer_sequential_custom_tool_snapshot(self):
+        """Test custom tools keeping their input get a snapshot by default"""
+        class AuditTool(BaseTool):
+            @property
+            def name(self):
+                return "audit_tool"
+
+            async def execute(self, params):
+                return {"audited_input": params["data"]}
+
+        setup_tools()
+        registry = get_tool_registry()
+        registry.register(AuditTool())
+        try:
+            result = await ToolComposerTool().execute({
+                "composition": {
+                    "type": "sequential",
+                    "tools": [
+                        {"tool": "audit_tool"},
+                        {"tool": "budget_optimizer", "params": {"budget": 1500}}
+                    ]
+                },
+                "data": {"destination": "Paris"}
+            })
+        finally:
+            registry.tools.pop("audit_tool", None)
+
+        assert result["results"]["audit_tool"]["audited_input"] == {"destination": "Paris"}
+        json.dumps(result)
+
+    async def test_tool_chain_independent_steps(self):
+        """Test independent chain steps share input data and keep chain order"""
+        setup_tools()
+        
+        result = await ToolChainTool().execute({
+            "chain": [
+                {"tool": "budget_optimizer", "params": {"budget": 1000}, "independent": True},
+                {"tool": "missing_tool", "independent": True},
+                {"tool": "planning_optimizer", "params": {"budget": 1000}, "independent": True},
+                {"tool": "summarizer"}
+            ],
+            "data": {"destination": "Paris"}
+        })
+        
+        chain_results = result["chain_results"]
+        assert list(chain_results) == [
+            "initial_data",
+            "step_budget_optimizer",
+            "error_missing_tool",
+            "step_planning_optimizer",
+            "step_summarizer"
+        ]
+        assert chain_results["step_budget_optimizer"]["total"] == 1000
+        assert result["final_data"] == chain_results["step_summarizer"]
+
+    async def test_tool_chain_independent_failure_cancels_siblings(self, failing_tool):
+        """Test a failing independent step cancels the steps running beside it"""
+        started = []
+        
+        class SlowTool(BaseTool):
+            @property
+            def name(self):
+                return "slow_tool"
+                
+            async def execute(self, params):
+                started.append(asyncio.current_task())
+                await asyncio.sleep(10)
+                return {"done": True}
+                
+        registry = failing_tool
+        registry.register(SlowTool())
+        try:
+            with pytest.raises(RuntimeError, match="tool exploded"):
+                await ToolChainTool().execute({
+                    "chain": [
+                        {"tool": "slow_tool", "independent": True},
+                        {"tool": "failing_tool", "independent": True}
+                    ]
+                })
+        finally:
+            registry.tools.pop("slow_tool", None)
+            
+        assert len(started) == 1
+        assert started[0].cancelled()
+
 
 class TestBaseAgent:
     """Test cases for BaseAgent class"""
@@ -308,6 +722,27 @@ class TestAgentFactory:
         assert agent.config.agent_type == "mock"
         assert agent.is_running
         
+    @pytest.mark.asyncio
+    async def test_create_agents_bulk(self, agent_factory, mock_agent_class):
+        """Test creating several agents in one call"""
+        agent_factory.register_agent_type("mock", mock_agent_class)
+        
+        agents = await agent_factory.create_agents_bulk([("agent1", "mock"), ("agent2", "mock")])
+        
+        assert [agent.name for agent in agents] == ["agent1", "agent2"]
+        assert all(agent.is_running for agent in agents)
+        assert set(agent_factory.agents) == {"agent1", "agent2"}
+        
+    @pytest.mark.asyncio
+    async def test_create_agents_bulk_unknown_type(self, agent_factory, mock_agent_class):
+        """Test bulk creation rejects unknown types before creating anything"""
+        agent_factory.register_agent_type("mock", mock_agent_class)
+        
+        with pytest.raises(ValueError, match="Unknown agent type: unknown"):
+            await agent_factory.create_agents_bulk([("agent1", "mock"), ("agent2", "unknown")])
+            
+        assert len(agent_factory.agents) == 0
+        
     def test_get_agent(self, agent_factory, mock_agent_class):
         """Test getting agent by name"""
         # Non-existent agent
@@ -336,6 +771,21 @@ class TestAgentFactory:
         assert len(agents_with_cap3) == 1
         assert agents_with_cap3[0].name == "agent2"
         
+    @pytest.mark.asyncio
+    async def test_capability_index_tracks_changes(self, agent_factory, mock_agent_class):
+        """Test capability lookups reflect capabilities added or removed after creation"""
+        agent_factory.register_agent_type("mock", mock_agent_class)
+        
+        config = AgentConfig(name="agent1", agent_type="mock", capabilities=["cap1"])
+        agent = await agent_factory.create_agent("agent1", "mock", config)
+        
+        agent.add_capability("cap2")
+        assert agent_factory.get_agents_by_capability("cap2") == [agent]
+        
+        agent.remove_capability("cap1")
+        assert agent_factory.get_agents_by_capability("cap1") == []
+        assert agent_factory.get_agents_by_capability("") == []
+        
     @pytest.mark.asyncio
     async def test_stop_all_agents(self, agent_factory, mock_agent_class):
         """Test stopping all agents"""
@@ -3,6 +3,7 @@ Integration tests for agent communication and workflow execution
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from google_adk import RuntimeConfig, RuntimeManager, AgentFactory, AgentOrchestrator
 from agents.research_agent import ResearchAgent
@@ -12,14 +13,14 @@ from workflows.travel_planning import create_travel_workflow
 from examples.tool_setup import setup_tools
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def full_system_setup():
-    """Setup complete system for integration testing"""
+    """Setup complete system once for all integration tests"""
     # Setup tools
     setup_tools()
     
     # Setup runtime
-    config = RuntimeConfig(environment="test")
+    config = RuntimeConfig(environment="testing")
     runtime = RuntimeManager(config)
     await runtime.start()
     
@@ -32,15 +33,26 @@ async def full_system_setup():
     factory.register_agent_type("coordinator", CoordinatorAgent)
     
     # Create agents
-    await factory.create_agent("research_agent", "research")
-    await factory.create_agent("planning_agent", "planning")
-    await factory.create_agent("coordinator_agent", "coordinator")
+    await factory.create_agents_bulk([
+        ("research_agent", "research"),
+        ("planning_agent", "planning"),
+        ("coordinator_agent", "coordinator")
+    ])
     
     yield factory, orchestrator
     
     await runtime.stop()
 
 
+@pytest.fixture(autouse=True)
+def reset_orchestrator_state(full_system_setup):
+    """Reset per-test orchestrator state on the shared system"""
+    yield
+    factory, orchestrator = full_system_setup
+    orchestrator.active_workflows.clear()
+    orchestrator.agent_state.clear()
+
+
 @pytest.mark.asyncio
 class TestAgentCommunication:
     """Test agent-to-agent communication patterns"""
@@ -118,6 +130,17 @@ class TestWorkflowExecution:
         assert final_plan["destination"] == "Barcelona"
         assert final_plan["budget"] == 2500
         assert final_plan["status"] == "finalized"
+
+    async def test_travel_workflow_steps_independent(self):
+        """Test each workflow request gets its own mutable steps"""
+        first = create_travel_workflow("Lisbon", 1800, 3)
+        first[1].params["days"] = 5
+        first[1].max_retries = 0
+
+        second = create_travel_workflow("Lisbon", 1800, 3)
+        assert second[1].params == {"budget": 1800, "days": 3}
+        assert second[1].max_retries == 3
+        assert second[2].depends_on == ("research_agent", "planning_agent")
         
     async def test_workflow_with_dependencies(self, full_system_setup):
         """Test workflow dependency resolution"""
@@ -167,6 +190,7 @@ class TestWorkflowExecution:
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("eager_tasks")
 class TestPerformanceBasics:
     """Basic performance and scalability tests"""
     
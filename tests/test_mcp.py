@@ -1 +1,97 @@
-# MCP communication tests
\ No newline at end of file
+"""
+Unit tests for the MCP protocol layer
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from mcp.messages import create_request, create_response, ResponseMessage
+
+
+@pytest.mark.asyncio
+class TestMCPProtocol:
+    """Test MCP protocol request handling"""
+
+    async def test_health_check_response(self, mcp_protocol):
+        """Test health check returns agent status as JSON"""
+        response = await mcp_protocol._handle_health_check(None)
+
+        assert response.status == 200
+        assert response.content_type == "application/json"
+
+        body = json.loads(response.body)
+        assert body["agent"] == "test_agent"
+        assert body["status"] == "healthy"
+        assert "timestamp" in body
+
+    async def test_health_check_body_cached(self, mcp_protocol):
+        """Test health check reuses the encoded body within the refresh interval"""
+        first = await mcp_protocol._handle_health_check(None)
+        second = await mcp_protocol._handle_health_check(None)
+
+        assert first.body is second.body
+
+        # Expiring the cache forces a fresh body
+        mcp_protocol._health_ts -= mcp_protocol._health_interval + 1
+        third = await mcp_protocol._handle_health_check(None)
+        assert third.body is not first.body
+
+    async def test_send_message_serializes_to_json_bytes(self, mcp_protocol, mock_http_response):
+        """Test outbound messages are posted as pre-encoded JSON bytes"""
+        post_context = MagicMock()
+        post_context.__aenter__ = AsyncMock(return_value=mock_http_response)
+        post_context.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.post = MagicMock(return_value=post_context)
+        session.close = AsyncMock()
+
+        mcp_protocol.session = session
+        mcp_protocol.is_connected = True
+
+        message = create_request("test_agent", "other_agent", "ping", {"value": 1})
+        assert await mcp_protocol.send_message(message)
+
+        _, kwargs = session.post.call_args
+        assert isinstance(kwargs["data"], bytes)
+        payload = json.loads(kwargs["data"])
+        assert payload["id"] == message.id
+        assert payload["method"] == "ping"
+        assert payload["params"] == {"value": 1}
+
+        args, _ = session.post.call_args
+        assert args[0] == f"{mcp_protocol._get_agent_endpoint('other_agent')}/mcp/message"
+        assert mcp_protocol._get_message_url("other_agent") is args[0]
+
+    async def test_process_message_dispatches_by_type(self, mcp_protocol):
+        """Test incoming messages are routed to the handler for their type"""
+        received = []
+
+        async def on_event(data):
+            received.append(data)
+
+        mcp_protocol.subscribe("trip_updated", on_event)
+        notification = mcp_protocol._parse_message_json(json.dumps({
+            "type": "notification",
+            "sender": "planning_agent",
+            "event": "trip_updated",
+            "data": {"destination": "Paris"},
+            "content": {}
+        }).encode())
+
+        await mcp_protocol._process_message(notification)
+        assert received == [{"destination": "Paris"}]
+
+    async def test_parse_message_json(self, mcp_protocol):
+        """Test raw JSON bodies parse directly into the matching message class"""
+        request = create_request("other_agent", "test_agent", "plan_trip", {"days": 3})
+        response = create_response(request, success=True, result={"optimized_plan": {"cost_savings": 150.0}})
+        body = response.__pydantic_serializer__.to_json(response)
+
+        parsed = mcp_protocol._parse_message_json(body)
+        assert type(parsed) is ResponseMessage
+        assert parsed.request_id == request.id
+        assert parsed.result == {"optimized_plan": {"cost_savings": 150.0}}
+
+        assert mcp_protocol._parse_message_json(b'{"type": "unknown"}') is None
+        assert mcp_protocol._parse_message_json(b"not json") is None
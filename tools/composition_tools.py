@@ -3,47 +3,134 @@ Tool composition and chaining capabilities
 """
 
 from .tool_registry import BaseTool, get_tool_registry
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, NamedTuple, Optional
 import asyncio
 
 
+# Shared default for steps without params; only ever copied, never mutated
+_EMPTY: Dict[str, Any] = {}
+
+
+class _CompiledStep(NamedTuple):
+    """A chain/composition step with its tool resolved and fields extracted"""
+    tool_name: str
+    tool: Optional[BaseTool]
+    params: Dict[str, Any]
+    independent: bool
+
+
+def _sync_fast_path(tool: BaseTool) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Return the tool's bound ``execute_sync`` if ``execute`` just delegates to it
+    
+    Looked up on the class so mocks don't grow one, and skipped when a subclass
+    overrides ``execute`` below the class that defined ``execute_sync``.
+    """
+    mro = type(tool).__mro__
+    sync_owner = next((cls for cls in mro if "execute_sync" in vars(cls)), None)
+    if sync_owner is None:
+        return None
+    execute_owner = next(cls for cls in mro if "execute" in vars(cls))
+    if mro.index(execute_owner) < mro.index(sync_owner):
+        return None
+    return tool.execute_sync
+
+
+def _compile_steps(steps: List[Dict[str, Any]], registry_get: Callable) -> List[_CompiledStep]:
+    """Resolve tools and extract step fields once, before any step runs"""
+    return [
+        _CompiledStep(
+            step.get("tool"),
+            registry_get(step.get("tool")),
+            step.get("params", _EMPTY),
+            bool(step.get("independent"))
+        )
+        for step in steps
+    ]
+
+
 class ToolChainTool(BaseTool):
     """Chain multiple tools together"""
     
+    def __init__(self):
+        super().__init__()
+        self._registry = get_tool_registry()
+        self._registry_get = self._registry.get
+        
     @property
     def name(self) -> str:
         return "tool_chain"
         
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a chain of tools"""
+        """Execute a chain of tools
+        
+        Consecutive steps marked ``"independent": True`` receive the same input
+        data and run concurrently; the last of them feeds the next step.
+        """
         chain = params.get("chain", [])
         initial_data = params.get("data", {})
         
-        registry = get_tool_registry()
         results = {"initial_data": initial_data}
         current_data = initial_data
         
-        for step in chain:
-            tool_name = step.get("tool")
-            tool_params = step.get("params", {})
+        batch = []
+        for step in _compile_steps(chain, self._registry_get):
+            if step.independent:
+                batch.append(step)
+                continue
+                
+            if batch:
+                current_data = await self._execute_batch(batch, current_data, results)
+                batch = []
+            current_data = await self._execute_batch([step], current_data, results)
             
-            # Merge current data with step params
-            merged_params = {**tool_params, "data": current_data}
+        if batch:
+            current_data = await self._execute_batch(batch, current_data, results)
+                
+        return {"chain_results": results, "final_data": current_data}
+        
+    async def _execute_batch(self, batch: List[_CompiledStep], current_data: Any, results: Dict[str, Any]) -> Any:
+        """Execute chain steps sharing the same input, recording results in chain order"""
+        calls = []
+        for _, tool, step_params, _ in batch:
+            if tool:
+                # Merge current data with step params
+                tool_params = step_params.copy()
+                tool_params["data"] = current_data
+                calls.append(tool.execute(tool_params))
+                
+        if len(calls) == 1:
+            outputs = iter([await calls[0]])
+        else:
+            tasks = [asyncio.ensure_future(call) for call in calls]
+            try:
+                outputs = iter(await asyncio.gather(*tasks))
+            finally:
+                # A failing step must not leave its siblings running
+                pending = [task for task in tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
             
-            tool = registry.get(tool_name)
+        for tool_name, tool, _, _ in batch:
             if tool:
-                result = await tool.execute(merged_params)
+                result = next(outputs)
                 results[f"step_{tool_name}"] = result
                 current_data = result
             else:
                 results[f"error_{tool_name}"] = f"Tool {tool_name} not found"
                 
-        return {"chain_results": results, "final_data": current_data}
+        return current_data
 
 
 class ToolComposerTool(BaseTool):
     """Compose tools in parallel or sequence"""
     
+    def __init__(self):
+        super().__init__()
+        self._registry = get_tool_registry()
+        self._registry_get = self._registry.get
+        
     @property
     def name(self) -> str:
         return "tool_composer"
@@ -53,49 +140,109 @@ class ToolComposerTool(BaseTool):
         composition = params.get("composition", {})
         execution_type = composition.get("type", "parallel")  # parallel or sequential
         tools_config = composition.get("tools", [])
+        fail_fast = composition.get("fail_fast", False)
         shared_data = params.get("data", {})
         
-        registry = get_tool_registry()
+        steps = _compile_steps(tools_config, self._registry_get)
         
         if execution_type == "parallel":
-            return await self._execute_parallel(tools_config, shared_data, registry)
+            return await self._execute_parallel(steps, shared_data, fail_fast)
         else:
-            return await self._execute_sequential(tools_config, shared_data, registry)
+            return await self._execute_sequential(steps, shared_data)
             
-    async def _execute_parallel(self, tools_config: List, shared_data: Dict, registry) -> Dict[str, Any]:
-        """Execute tools in parallel"""
-        tasks = []
+    async def _execute_parallel(self, steps: List[_CompiledStep], shared_data: Dict,
+                                fail_fast: bool = False) -> Dict[str, Any]:
+        """Execute tools in parallel
         
-        for config in tools_config:
-            tool_name = config.get("tool")
-            tool_params = {**config.get("params", {}), "data": shared_data}
+        With ``fail_fast`` the first failing tool cancels the ones still running;
+        otherwise every tool runs to completion and failures are reported per tool.
+        """
+        if fail_fast:
+            return await self._execute_fail_fast(steps, shared_data)
             
-            tool = registry.get(tool_name)
-            if tool:
-                tasks.append((tool_name, tool.execute(tool_params)))
+        results = {}
+        names, coros = [], []
+        for tool_name, tool, step_params, _ in steps:
+            if not tool:
+                results[tool_name] = f"Tool {tool_name} not found"
+                continue
+                
+            tool_params = step_params.copy()
+            tool_params["data"] = shared_data
+            
+            # CPU-only tools run inline instead of paying for a coroutine and task
+            execute_sync = _sync_fast_path(tool)
+            if execute_sync is not None:
+                results[tool_name] = self._execute_sync_isolated(execute_sync, tool_params)
+            else:
+                names.append(tool_name)
+                coros.append(tool.execute(tool_params))
                 
+        if coros:
+            completed = await asyncio.gather(*coros, return_exceptions=True)
+            results.update(
+                (tool_name, str(result) if isinstance(result, Exception) else result)
+                for tool_name, result in zip(names, completed)
+            )
+            
+        return {"execution_type": "parallel", "results": results}
+        
+    async def _execute_fail_fast(self, steps: List[_CompiledStep], shared_data: Dict) -> Dict[str, Any]:
+        """Execute tools concurrently, cancelling the rest on the first failure"""
+        # A list, not a dict: a tool listed twice still gets both tasks tracked
+        tasks = []
         results = {}
-        if tasks:
-            completed = await asyncio.gather(*[task[1] for task in tasks], return_exceptions=True)
-            for i, (tool_name, _) in enumerate(tasks):
-                results[tool_name] = completed[i] if not isinstance(completed[i], Exception) else str(completed[i])
+        
+        for tool_name, tool, step_params, _ in steps:
+            if tool:
+                tool_params = step_params.copy()
+                tool_params["data"] = shared_data
+                tasks.append((tool_name, asyncio.ensure_future(tool.execute(tool_params))))
+            else:
+                results[tool_name] = f"Tool {tool_name} not found"
+                
+        try:
+            if tasks:
+                await asyncio.wait([task for _, task in tasks], return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Also reached when this call itself is cancelled, so no task outlives it
+            pending = [task for _, task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
                 
+        for tool_name, task in tasks:
+            if task.cancelled():
+                continue
+            error = task.exception()
+            results[tool_name] = str(error) if error else task.result()
+            
         return {"execution_type": "parallel", "results": results}
         
-    async def _execute_sequential(self, tools_config: List, shared_data: Dict, registry) -> Dict[str, Any]:
+    @staticmethod
+    def _execute_sync_isolated(execute_sync: Callable[[Dict[str, Any]], Any], params: Dict[str, Any]) -> Any:
+        """Execute a tool's synchronous fast path, reporting failures as strings"""
+        try:
+            return execute_sync(params)
+        except Exception as e:
+            return str(e)
+        
+    async def _execute_sequential(self, steps: List[_CompiledStep], shared_data: Dict) -> Dict[str, Any]:
         """Execute tools sequentially"""
         results = {}
-        current_data = shared_data
+        current_data = dict(shared_data)
         
-        for config in tools_config:
-            tool_name = config.get("tool")
-            tool_params = {**config.get("params", {}), "data": current_data}
-            
-            tool = registry.get(tool_name)
+        for tool_name, tool, step_params, _ in steps:
             if tool:
+                # Tools that keep their input (validate_data echoes it) get a
+                # snapshot; the rest read the accumulator we keep updating
+                tool_params = step_params.copy()
+                tool_params["data"] = dict(current_data) if tool.retains_input else current_data
+                
                 result = await tool.execute(tool_params)
                 results[tool_name] = result
                 # Pass result to next tool
-                current_data = {**current_data, **result}
+                current_data.update(result)
                 
         return {"execution_type": "sequential", "results": results}
\ No newline at end of file
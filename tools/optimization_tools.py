@@ -3,37 +3,82 @@ Advanced planning and optimization tools
 """
 
 from .tool_registry import BaseTool
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import functools
+
+
+# Share of the trip budget assigned to each category
+_ALLOC_RATIOS = (
+    ("accommodation", 0.4),
+    ("activities", 0.3),
+    ("food", 0.2),
+    ("transport", 0.1)
+)
+
+# Budget optimizer split; ratios sum to 1.0 so the total equals the budget
+_BUDGET_RATIOS = {
+    "hotel": 0.35,
+    "food": 0.25,
+    "activities": 0.25,
+    "transport": 0.15
+}
+
+_BUDGET_RECOMMENDATIONS = ("Book early for hotel savings", "Use public transport")
+
+# Result layout shared by every budget optimization; copied and filled per call
+_BUDGET_RESULT_TMPL = {
+    "allocations": None,
+    "total": 0,
+    "savings_potential": 0.0,
+    "recommendations": _BUDGET_RECOMMENDATIONS
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _schedule(days: int) -> Tuple[Dict[str, Any], ...]:
+    """Build the per-day efficiency schedule for a trip length"""
+    return tuple(
+        {"day": i+1, "efficiency_score": 0.85 + (i * 0.05)}
+        for i in range(days)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _optimize_plan(budget: float, days: int) -> Dict[str, Any]:
+    """Build the optimized plan for a budget and trip length (shared, never mutate)"""
+    # Simple optimization logic
+    return {
+        "budget_allocation": {k: budget * r for k, r in _ALLOC_RATIOS},
+        "schedule_optimization": _schedule(days),
+        "cost_savings": budget * 0.15,
+        "time_efficiency": 0.92
+    }
 
 
 class PlanningOptimizerTool(BaseTool):
     """Advanced planning optimization"""
     
+    retains_input = False
+    
     @property
     def name(self) -> str:
         return "planning_optimizer"
         
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize travel plan"""
+        return self.execute_sync(params)
+        
+    def execute_sync(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Optimize travel plan without a coroutine (CPU-only fast path)"""
         budget = params.get("budget", 1000)
         days = params.get("days", 3)
         priorities = params.get("priorities", ["cost", "time"])
         
-        # Simple optimization logic
-        optimized_plan = {
-            "budget_allocation": {
-                "accommodation": budget * 0.4,
-                "activities": budget * 0.3,
-                "food": budget * 0.2,
-                "transport": budget * 0.1
-            },
-            "schedule_optimization": [
-                {"day": i+1, "efficiency_score": 0.85 + (i * 0.05)} 
-                for i in range(days)
-            ],
-            "cost_savings": budget * 0.15,
-            "time_efficiency": 0.92
-        }
+        # The cached plan for (budget, days) acts as the template; copy its containers
+        plan = _optimize_plan(budget, days)
+        optimized_plan = plan.copy()
+        optimized_plan["budget_allocation"] = plan["budget_allocation"].copy()
+        optimized_plan["schedule_optimization"] = [entry.copy() for entry in plan["schedule_optimization"]]
         
         return {"optimized_plan": optimized_plan, "priorities_applied": priorities}
 
@@ -41,26 +86,25 @@ class PlanningOptimizerTool(BaseTool):
 class BudgetOptimizerTool(BaseTool):
     """Budget optimization and allocation"""
     
+    retains_input = False
+    
     @property
     def name(self) -> str:
         return "budget_optimizer"
         
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize budget allocation"""
+        return self.execute_sync(params)
+        
+    def execute_sync(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Optimize budget allocation without a coroutine (CPU-only fast path)"""
         total_budget = params.get("budget", 1000)
         categories = params.get("categories", ["hotel", "food", "activities", "transport"])
         
         # Smart budget allocation
-        allocations = {
-            "hotel": total_budget * 0.35,
-            "food": total_budget * 0.25,
-            "activities": total_budget * 0.25,
-            "transport": total_budget * 0.15
-        }
+        result = _BUDGET_RESULT_TMPL.copy()
+        result["allocations"] = {k: total_budget * r for k, r in _BUDGET_RATIOS.items()}
+        result["total"] = total_budget
+        result["savings_potential"] = total_budget * 0.1
         
-        return {
-            "allocations": allocations,
-            "total": sum(allocations.values()),
-            "savings_potential": total_budget * 0.1,
-            "recommendations": ["Book early for hotel savings", "Use public transport"]
-        }
\ No newline at end of file
+        return result
\ No newline at end of file
@@ -3,59 +3,134 @@ Data validation and quality checking tools
 """
 
 from .tool_registry import BaseTool
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple, Callable
+import asyncio
+import functools
+import inspect
 
 
-class DataQualityTool(BaseTool):
-    """Data quality validation and scoring"""
+@functools.lru_cache(maxsize=128)
+def _quality_checker(required_fields: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Tuple[float, List[str]]]:
+    """Build a quality checker specialized for one set of required fields"""
+    # Bit i of the mask tracks required_fields[i]; repeated names share all their bits
+    field_bits: Dict[str, int] = {}
+    for i, field in enumerate(required_fields):
+        field_bits[field] = field_bits.get(field, 0) | 1 << i
+    all_fields = (1 << len(required_fields)) - 1
     
-    @property
-    def name(self) -> str:
-        return "data_quality"
-        
-    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Check data quality"""
-        data = params.get("data", {})
-        
+    def check(data: Dict[str, Any]) -> Tuple[float, List[str]]:
         quality_score = 0.0
         issues = []
         
+        # Completeness and empty strings are gathered in one pass over the data
+        seen = 0
+        empty_string = False
+        for key, value in data.items():
+            if value:
+                seen |= field_bits.get(key, 0)
+            if type(value) is str and (not value or value.isspace()):
+                empty_string = True
+        
         # Check completeness
-        required_fields = params.get("required_fields", [])
-        missing_fields = [f for f in required_fields if f not in data or not data[f]]
-        if missing_fields:
+        missing = all_fields & ~seen
+        if missing:
+            missing_fields = [f for i, f in enumerate(required_fields) if missing >> i & 1]
             issues.append(f"Missing fields: {missing_fields}")
             quality_score -= 0.3
         else:
             quality_score += 0.4
             
         # Check data types
-        if any(isinstance(v, str) and not v.strip() for v in data.values()):
+        if empty_string:
             issues.append("Empty string values found")
             quality_score -= 0.2
         else:
             quality_score += 0.3
             
-        # Check ranges
+        # Check ranges; the product is negative only outside [100, 50000]
         budget = data.get("budget")
-        if budget and (budget < 100 or budget > 50000):
+        if budget and (budget - 100) * (50000 - budget) < 0:
             issues.append("Budget outside reasonable range")
             quality_score -= 0.2
         else:
             quality_score += 0.3
             
-        quality_score = max(0.0, min(1.0, quality_score))
+        return quality_score, issues
         
-        return {
-            "quality_score": quality_score,
-            "issues": issues,
-            "status": "good" if quality_score > 0.7 else "needs_improvement"
-        }
+    return check
+
+
+def _quality_result(quality_score: float, issues: List[str]) -> Dict[str, Any]:
+    quality_score = max(0.0, min(1.0, quality_score))
+    
+    return {
+        "quality_score": quality_score,
+        "issues": issues,
+        "status": "good" if quality_score > 0.7 else "needs_improvement"
+    }
+
+
+class DataQualityTool(BaseTool):
+    """Data quality validation and scoring"""
+    
+    retains_input = False
+    
+    @property
+    def name(self) -> str:
+        return "data_quality"
+        
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Check data quality"""
+        data = params.get("data", {})
+        required_fields = params.get("required_fields", [])
+        
+        # Checkers are specialized and cached per required field set
+        return _quality_result(*_quality_checker(tuple(required_fields))(data))
+        
+    def execute_batch(self, records: List[Dict[str, Any]],
+                      required_fields: List[str] = ()) -> List[Dict[str, Any]]:
+        """Check data quality for many records sharing one rule set"""
+        check = _quality_checker(tuple(required_fields))
+        return [_quality_result(*check(record)) for record in records]
+
+
+_CHECK_NAMES = ("budget_check", "schedule_check", "location_check")
+
+# Failure/success message per check, indexed by the check's bit
+_CHECK_MESSAGES = (
+    ("Invalid budget", "Budget valid"),
+    ("No schedule provided", "Schedule valid"),
+    ("No destination specified", "Destination valid")
+)
+
+_ALL_CHECKS_VALID = 0b111
+
+
+def _budget_valid(plan: Dict) -> bool:
+    return plan.get("budget", 0) > 0
+
+
+def _schedule_valid(plan: Dict) -> bool:
+    return len(plan.get("schedule", [])) > 0
+
+
+def _locations_valid(plan: Dict) -> bool:
+    destination = plan.get("destination")
+    return bool(destination and not destination.isspace())
+
+
+# Checks in bit order; any check may be a coroutine function
+_PLAN_CHECKS = (_budget_valid, _schedule_valid, _locations_valid)
+
+# Fast mode runs checks cheapest-first as (check index, reported name)
+_FAST_CHECK_ORDER = ((0, "budget"), (2, "location"), (1, "schedule"))
 
 
 class PlanValidatorTool(BaseTool):
     """Travel plan validation"""
     
+    retains_input = False
+    
     @property
     def name(self) -> str:
         return "plan_validator"
@@ -64,13 +139,28 @@ class PlanValidatorTool(BaseTool):
         """Validate travel plan feasibility"""
         plan = params.get("plan", {})
         
-        validation_results = {
-            "budget_check": self._validate_budget(plan),
-            "schedule_check": self._validate_schedule(plan),
-            "location_check": self._validate_locations(plan)
-        }
+        if params.get("fast"):
+            return await self._validate_fast(plan)
+        
+        outcomes = [check(plan) for check in _PLAN_CHECKS]
+        
+        # Async checks run concurrently; sync checks have already finished
+        pending = [i for i, outcome in enumerate(outcomes) if inspect.isawaitable(outcome)]
+        if pending:
+            completed = await asyncio.gather(*(outcomes[i] for i in pending))
+            for i, outcome in zip(pending, completed):
+                outcomes[i] = outcome
         
-        overall_valid = all(r["valid"] for r in validation_results.values())
+        # bit0=budget, bit1=schedule, bit2=location
+        bits = 0
+        for i, valid in enumerate(outcomes):
+            bits |= bool(valid) << i
+        overall_valid = bits == _ALL_CHECKS_VALID
+        
+        validation_results = {}
+        for i, check in enumerate(_CHECK_NAMES):
+            valid = bits >> i & 1
+            validation_results[check] = {"valid": bool(valid), "message": _CHECK_MESSAGES[i][valid]}
         
         return {
             "valid": overall_valid,
@@ -78,23 +168,13 @@ class PlanValidatorTool(BaseTool):
             "confidence": 0.9 if overall_valid else 0.4
         }
         
-    def _validate_budget(self, plan: Dict) -> Dict[str, Any]:
-        budget = plan.get("budget", 0)
-        return {
-            "valid": budget > 0,
-            "message": "Budget valid" if budget > 0 else "Invalid budget"
-        }
+    async def _validate_fast(self, plan: Dict) -> Dict[str, Any]:
+        """Stop at the first failing check, skipping the per-check report"""
+        for i, check_name in _FAST_CHECK_ORDER:
+            valid = _PLAN_CHECKS[i](plan)
+            if inspect.isawaitable(valid):
+                valid = await valid
+            if not valid:
+                return {"valid": False, "failed": check_name, "confidence": 0.4}
         
-    def _validate_schedule(self, plan: Dict) -> Dict[str, Any]:
-        schedule = plan.get("schedule", [])
-        return {
-            "valid": len(schedule) > 0,
-            "message": "Schedule valid" if schedule else "No schedule provided"
-        }
-        
-    def _validate_locations(self, plan: Dict) -> Dict[str, Any]:
-        destination = plan.get("destination")
-        return {
-            "valid": bool(destination and destination.strip()),
-            "message": "Destination valid" if destination else "No destination specified"
-        }
\ No newline at end of file
+        return {"valid": True, "failed": None, "confidence": 0.9}
@@ -3,13 +3,84 @@ Reporting and summary generation tools
 """
 
 from .tool_registry import BaseTool
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple, Callable, Tuple
 import json
+import functools
+
+
+_JSON_SEPARATORS = (",", ":")
+
+_RISK_ASSESSMENT = "Low risk for standard travel"
+_ALTERNATIVES = ("Budget option", "Premium option")
+
+# Detailed report layout with the constant fields already encoded
+_DETAILED_JSON = (
+    '{"report_type":"detailed","executive_summary":%s,"budget_breakdown":%s,'
+    '"daily_schedule":%s,"recommendations":%s,'
+    + json.dumps({"risk_assessment": _RISK_ASSESSMENT, "alternatives": _ALTERNATIVES},
+                 separators=_JSON_SEPARATORS)[1:]
+)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _cached_summary(destination: Any, budget: Any, days: Any, activity_count: int) -> Dict[str, Any]:
+    return {
+        "report_type": "summary",
+        "destination": destination,
+        "total_budget": budget,
+        "duration": days,
+        "key_highlights": [
+            f"Budget: ${budget}",
+            f"Duration: {days} days",
+            f"Activities: {activity_count}"
+        ],
+        "status": "Ready for travel"
+    }
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _cached_summary_json(destination: Any, budget: Any, days: Any, activity_count: int) -> str:
+    summary = _summary_lookup(_cached_summary, (destination, budget, days, activity_count))
+    return json.dumps(summary, separators=_JSON_SEPARATORS)
+
+
+def _summary_lookup(cached: Callable, key: Tuple) -> Any:
+    """Call a summary cache, building uncached when a plan value is unhashable"""
+    try:
+        return cached(*key)
+    except TypeError:
+        # e.g. a multi-city destination list or a {"total", "currency"} budget
+        return cached.__wrapped__(*key)
+
+
+class _PlanFields(NamedTuple):
+    """Every plan field a report reads; the first four key the summary cache"""
+    destination: Any
+    budget: Any
+    days: Any
+    activity_count: int
+    budget_allocation: Dict[str, Any]
+    schedule: List[Any]
+    recommendations: List[Any]
+
+
+def _extract(data: Dict) -> _PlanFields:
+    return _PlanFields(
+        data.get("destination", "Unknown"),
+        data.get("budget", 0),
+        data.get("days", 0),
+        len(data.get("activities", [])),
+        data.get("budget_allocation", {}),
+        data.get("schedule", []),
+        data.get("recommendations", [])
+    )
 
 
 class ReportGeneratorTool(BaseTool):
     """Generate comprehensive reports"""
     
+    retains_input = False
+    
     @property
     def name(self) -> str:
         return "report_generator"
@@ -19,42 +90,60 @@ class ReportGeneratorTool(BaseTool):
         plan_data = params.get("plan_data", {})
         format_type = params.get("format", "summary")
         
+        fields = _extract(plan_data)
         if format_type == "detailed":
-            return self._detailed_report(plan_data)
+            return self._detailed_report(fields)
         else:
-            return self._summary_report(plan_data)
+            return self._summary_report(fields)
             
-    def _summary_report(self, data: Dict) -> Dict[str, Any]:
+    def to_json_bytes(self, plan_data: Dict[str, Any], format_type: str = "summary") -> bytes:
+        """Encode a report straight to JSON bytes without building the report dict"""
+        fields = _extract(plan_data)
+        summary = _summary_lookup(_cached_summary_json, fields[:4])
+        if format_type != "detailed":
+            return summary.encode()
+        
+        return (_DETAILED_JSON % (
+            summary,
+            json.dumps(fields.budget_allocation, separators=_JSON_SEPARATORS),
+            json.dumps(fields.schedule, separators=_JSON_SEPARATORS),
+            json.dumps(fields.recommendations, separators=_JSON_SEPARATORS)
+        )).encode()
+            
+    def _summary_report(self, fields: _PlanFields) -> Dict[str, Any]:
         """Generate summary report"""
-        return {
-            "report_type": "summary",
-            "destination": data.get("destination", "Unknown"),
-            "total_budget": data.get("budget", 0),
-            "duration": data.get("days", 0),
-            "key_highlights": [
-                f"Budget: ${data.get('budget', 0)}",
-                f"Duration: {data.get('days', 0)} days",
-                f"Activities: {len(data.get('activities', []))}"
-            ],
-            "status": "Ready for travel"
-        }
+        # Keyed only on the fields the summary reads, so unrelated plan edits still hit
+        report = _summary_lookup(_cached_summary, fields[:4])
+        return {**report, "key_highlights": list(report["key_highlights"])}
         
-    def _detailed_report(self, data: Dict) -> Dict[str, Any]:
+    def _detailed_report(self, fields: _PlanFields) -> Dict[str, Any]:
         """Generate detailed report"""
         return {
             "report_type": "detailed",
-            "executive_summary": self._summary_report(data),
-            "budget_breakdown": data.get("budget_allocation", {}),
-            "daily_schedule": data.get("schedule", []),
-            "recommendations": data.get("recommendations", []),
-            "risk_assessment": "Low risk for standard travel",
-            "alternatives": ["Budget option", "Premium option"]
+            "executive_summary": self._summary_report(fields),
+            "budget_breakdown": fields.budget_allocation,
+            "daily_schedule": fields.schedule,
+            "recommendations": fields.recommendations,
+            "risk_assessment": _RISK_ASSESSMENT,
+            "alternatives": list(_ALTERNATIVES)
         }
 
 
+# Summary points in output order: (data key, prefix, suffix)
+_SUMMARY_FIELDS = (
+    ("destination", "Destination: ", ""),
+    ("budget", "Budget: $", ""),
+    ("days", "Duration: ", " days"),
+    ("activities", "Activities planned: ", ""),
+    ("status", "Status: ", "")
+)
+
+
 class SummaryTool(BaseTool):
     """Quick summary generation"""
     
+    retains_input = False
+    
     @property
     def name(self) -> str:
         return "summarizer"
@@ -66,18 +155,20 @@ class SummaryTool(BaseTool):
         
         summary_points = []
         
-        if "destination" in data:
-            summary_points.append(f"Destination: {data['destination']}")
-        if "budget" in data:
-            summary_points.append(f"Budget: ${data['budget']}")
-        if "days" in data:
-            summary_points.append(f"Duration: {data['days']} days")
-        if "activities" in data:
-            summary_points.append(f"Activities planned: {len(data['activities'])}")
-        if "status" in data:
-            summary_points.append(f"Status: {data['status']}")
+        for key, prefix, suffix in _SUMMARY_FIELDS:
+            # Points past max_points would only be sliced away
+            if len(summary_points) == max_points:
+                break
+            if key in data:
+                value = data[key]
+                if key == "activities":
+                    value = len(value)
+                summary_points.append(f"{prefix}{value}{suffix}")
             
+        summary_points = summary_points[:max_points]
+        
         return {
-            "summary": summary_points[:max_points],
-            "word_count": sum(len(point.split()) for point in summary_points[:max_points])
+            "summary": summary_points,
+            # One split over the joined points instead of one list per point
+            "word_count": len(" ".join(summary_points).split())
         }
\ No newline at end of file
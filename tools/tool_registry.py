@@ -2,13 +2,17 @@
 Tool Registry and Interface
 """
 
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Awaitable
 from abc import ABC, abstractmethod
 
 
 class BaseTool(ABC):
     """Base interface for all tools"""
     
+    # Sequential compositions hand a snapshot of the accumulated "data" to tools
+    # that may keep a reference to it; tools that never do can opt out
+    retains_input: bool = True
+    
     @abstractmethod
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool with given parameters"""
@@ -35,6 +39,10 @@ class ToolRegistry:
         """Get a tool by name"""
         return self.tools.get(name)
     
+    def call(self, name: str, params: Dict[str, Any]) -> Awaitable[Dict[str, Any]]:
+        """Start a tool call by name; raises KeyError for unknown tools before anything runs"""
+        return self.tools[name].execute(params)
+    
     def list_available(self) -> list:
         """List all available tools"""
         return list(self.tools.keys())
@@ -3,6 +3,71 @@ Data Validation Tool
 """
 
 from .tool_registry import BaseTool
+from typing import Dict, Any, Callable, List, Tuple
+import functools
+import operator
+
+_RULE_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "in": lambda value, allowed: value in allowed,
+    "not_null": lambda value, _: True
+}
+
+_OPERAND_OPS = frozenset({"lt", "gt", "in"})
+
+
+def _freeze_rule(rule: Any) -> Any:
+    """Normalize a rule into a hashable (op, field, operand) tuple; named rules pass through"""
+    if isinstance(rule, str):
+        return rule
+    if not isinstance(rule, (list, tuple)) or len(rule) not in (2, 3):
+        raise ValueError(f"Invalid validation rule {rule!r}: expected [op, field] or [op, field, operand]")
+    
+    op, field = rule[0], rule[1]
+    if op not in _RULE_OPS:
+        raise ValueError(f"Invalid validation rule {rule!r}: unknown op {op!r}")
+    if not isinstance(field, str):
+        raise ValueError(f"Invalid validation rule {rule!r}: field must be a string")
+    if op in _OPERAND_OPS and len(rule) != 3:
+        raise ValueError(f"Invalid validation rule {rule!r}: {op!r} needs an operand")
+    
+    value = rule[2] if len(rule) == 3 else None
+    if op == "in" and isinstance(value, str):
+        # "in" against a string would quietly become a substring test
+        raise ValueError(f"Invalid validation rule {rule!r}: 'in' needs a collection, not a string")
+    if isinstance(value, list):
+        value = tuple(value)
+    elif isinstance(value, set):
+        value = frozenset(value)
+    try:
+        hash(value)
+    except TypeError:
+        raise ValueError(f"Invalid validation rule {rule!r}: operand must be hashable") from None
+    return op, field, value
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_rules(rules: Tuple[Any, ...]) -> Callable[[Dict[str, Any]], bool]:
+    """Compile frozen rules into one predicate, cached per rule set"""
+    # Named rules are counted but not enforced yet
+    structured = [rule for rule in rules if not isinstance(rule, str)]
+    checks = tuple((field, _RULE_OPS[op], value) for op, field, value in structured)
+    
+    def predicate(data: Dict[str, Any]) -> bool:
+        for field, check, value in checks:
+            # Every structured rule requires its field to be present
+            current = data.get(field)
+            if current is None:
+                return False
+            try:
+                if not check(current, value):
+                    return False
+            except TypeError:
+                return False
+        return True
+        
+    return predicate
 
 
 class ValidationTool(BaseTool):
@@ -12,13 +77,18 @@ class ValidationTool(BaseTool):
     def name(self) -> str:
         return "validate_data"
     
+    @staticmethod
+    def compile_rules(rules: List[Any]) -> Callable[[Dict[str, Any]], bool]:
+        """Get the compiled predicate for (op, field, operand) rules: lt, gt, in, not_null"""
+        return _compile_rules(tuple(_freeze_rule(rule) for rule in rules))
+    
     async def execute(self, params):
         """Execute data validation"""
         data = params.get("data", {})
         rules = params.get("rules", [])
         
         return {
-            "valid": True,
+            "valid": self.compile_rules(rules)(data),
             "data": data,
             "rules_checked": len(rules)
-        }
\ No newline at end of file
+        }
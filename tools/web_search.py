@@ -4,10 +4,15 @@ Web Search Tool
 
 from .tool_registry import BaseTool
 
+# Placeholder fields shared by every result row
+_RESULT_STATIC = {"url": "https://example.com", "snippet": "Sample result"}
+
 
 class WebSearchTool(BaseTool):
     """Tool for web search and research"""
     
+    retains_input = False
+    
     @property
     def name(self) -> str:
         return "web_search"
@@ -18,6 +23,6 @@ class WebSearchTool(BaseTool):
         return {
             "query": query,
             "results": [
-                {"title": f"Result for {query}", "url": "https://example.com", "snippet": "Sample result"}
+                {"title": f"Result for {query}", **_RESULT_STATIC}
             ]
         }
\ No newline at end of file
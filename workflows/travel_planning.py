@@ -4,6 +4,10 @@ Simple travel planning workflow
 
 from google_adk.orchestrator import ConversationStep
 
+# Dependencies are identical for every workflow, so all steps share these tuples
+_PLANNING_DEPENDS_ON = ("research_agent",)
+_FINALIZE_DEPENDS_ON = ("research_agent", "planning_agent")
+
 
 def create_travel_workflow(destination: str, budget: int, days: int) -> list:
     """Create travel planning workflow steps"""
@@ -17,12 +21,12 @@ def create_travel_workflow(destination: str, budget: int, days: int) -> list:
             agent_name="planning_agent",
             method="create_itinerary",
             params={"budget": budget, "days": days},
-            depends_on=["research_agent"]
+            depends_on=_PLANNING_DEPENDS_ON
         ),
         ConversationStep(
             agent_name="coordinator_agent", 
             method="finalize_plan",
             params={},
-            depends_on=["research_agent", "planning_agent"]
+            depends_on=_FINALIZE_DEPENDS_ON
         )
-    ]
\ No newline at end of file
+    ]